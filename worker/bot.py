@@ -1,10 +1,16 @@
-import requests
+import asyncio
+import httpx
 import os
+import re
 import json
 import time
 import logging
+import sqlite3
+import functools
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 # --- Sofascore Imports ---
 from esd.sofascore import (
@@ -15,9 +21,31 @@ from esd.sofascore import (
     Event
 ) 
 
+# --- LOCAL STATE ---
+@dataclass(slots=True)
+class MatchState:
+    """Local betting state of a tracked match."""
+    bet_placed: bool = False # 36' window handled (bet placed or score not eligible)
+    bet_score: Optional[str] = None
+    bet_status: str = 'none' # 'none', 'unresolved', 'resolved'
+
 # --- GLOBAL VARIABLES ---
 SOFASCORE_CLIENT = None 
-LOCAL_TRACKED_MATCHES: Dict[str, Dict[str, Any]] = {} 
+LOCAL_TRACKED_MATCHES: Dict[int, MatchState] = {} # Keyed by Sofascore event id
+# fixture_id -> time.monotonic() of the last cycle that saw the match live
+_TRACKED_MATCHES_LAST_SEEN: Dict[int, float] = {}
+# event_id -> True if the event is an amateur/youth fixture (names don't change mid-match)
+_AMATEUR_FILTER_CACHE: Dict[int, bool] = {}
+# event_id -> display info for Telegram messages (tournament metadata doesn't change mid-match)
+_MATCH_INFO_CACHE: Dict[int, Dict[str, Any]] = {}
+# (team_id, tournament_id) -> (inserted_at, stats). Only successful parses are stored.
+_TEAM_STATS_CACHE: Dict[Tuple[int, int], Tuple[float, TeamTournamentStats]] = {}
+# (fetched_at, events) of the last successful live fetch, reused within LIVE_EVENTS_CACHE_TTL
+_LIVE_EVENTS_CACHE: Optional[Tuple[float, List[Any]]] = None
+# SQLite copy of LOCAL_TRACKED_MATCHES so bets survive a restart (opened by load_tracked_matches)
+_STATE_DB: Optional[sqlite3.Connection] = None
+# fixture_id -> row as last written to _STATE_DB, so a save only writes what changed
+_PERSISTED_STATE: Dict[int, Tuple[bool, Optional[str], str]] = {}
 
 # Set up logging
 logging.basicConfig(
@@ -31,27 +59,83 @@ logging.basicConfig(
 logger = logging.getLogger("FootballBettingBot")
 
 # Load environment variables
-TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
+TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN") or os.getenv("TELEGRAM_BOT_TOKEN") # Legacy name kept as fallback
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+STATE_DB_PATH = os.getenv("BOT_STATE_DB", "bot_state.db")
+_TELEGRAM_SEND_URL = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage" # Built once, used for every send
+
+# Event loop that delivers Telegram messages without blocking the bot cycle
+# (set by start_telegram_delivery, which main.py calls before the first send)
+_TELEGRAM_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_TELEGRAM_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+# Producers (the bot thread) put lists of messages here, a cycle's batch as one
+# item, so _telegram_sender() always sees it whole; it delivers them
+_TELEGRAM_QUEUE: Optional["asyncio.Queue[List[str]]"] = None
+_TELEGRAM_SENDER_TASK: Optional[asyncio.Task] = None
+
+# Signals produced during a cycle, sent in coalesced batches by flush_telegram()
+_PENDING_TELEGRAM_MESSAGES: List[str] = []
 
 # --- CONSTANTS ---
 SLEEP_TIME = 60
-MINUTES_REGULAR_BET = [36, 37]
+MINUTES_REGULAR_BET = frozenset({36, 37})
+REGULAR_BET_SCORES = frozenset({'1-1', '2-2', '3-3'}) # 36' scores that trigger the correct-score bet
 BET_TYPE_REGULAR = 'regular'
-STATUS_LIVE = ['LIVE', '1H', '2H', 'ET', 'P']
+STATUS_LIVE = frozenset({'LIVE', '1H', '2H', 'ET', 'P'})
 STATUS_HALFTIME = 'HT'
-STATUS_FINISHED = ['FT', 'AET', 'PEN'] 
+STATUS_FINISHED = frozenset({'FT', 'AET', 'PEN'})
+# Sofascore status description fragment -> bot status code (checked in this order)
+_STATUS_MAP = {
+    '1ST HALF': '1H',
+    '2ND HALF': '2H',
+    'HALFTIME': STATUS_HALFTIME,
+    'FINISHED': 'FT',
+    'ENDED': 'FT',
+    'CANCELLED': 'FT',
+}
 MAX_FETCH_RETRIES = 3 
+TEAM_STATS_CACHE_TTL = 1800 # Season averages barely move within 30 minutes
+TEAM_STATS_CACHE_MAXSIZE = 2048
+LIVE_EVENTS_CACHE_TTL = 30 # Shorter than SLEEP_TIME, so a regular cycle always sees fresh data
+TELEGRAM_BATCH_MAX_CHARS = 4000 # Telegram rejects messages over 4096 chars
+TELEGRAM_BATCH_SEPARATOR = '\n\n---\n\n'
+TRACKED_MATCH_TTL = 4 * 3600 # Any match unseen for 4h has ended or been dropped by the API
 
 # --- 🟢 AVERAGE GOAL CONSTANT (Kept for reference/logging) ---
 MIN_TOTAL_AVERAGE_GOALS = float(os.getenv("MIN_TOTAL_AVERAGE_GOALS", 3.0)) 
+_MIN_GOALS_STR = f"{MIN_TOTAL_AVERAGE_GOALS:.2f}" # Constant, so formatted once at import
 # --------------------------------------
 
+# --- MESSAGE TEMPLATES ---
+_REGULAR_BET_TEMPLATE = (
+    "⏱️ **36' - {match_name}**\n"
+    "🌍 {country} | 🏆 {league_name}\n"
+    "🔢 Score: {score}\n"
+    "🎯 Correct Score Bet Placed for Half Time\n\n"
+
+    "📊 *Average Goal Stats* (Min Ref: {min_goals}):\n"
+    "• *Home Avg*: {home_avg:.2f}\n"
+    "• *Away Avg*: {away_avg:.2f}\n"
+    "• *Total Avg*: {total_avg:.2f}"
+)
+
+_HT_RESULT_TEMPLATE = (
+    "{icon} **HT Result: {{match_name}}**\n"
+    "🌍 {{country}} | 🏆 {{league_name}}\n"
+    "🔢 HT Score: **{{ht_score}}**\n"
+    "🎯 Bet Score: **{{bet_score}}**\n"
+    "{verdict}"
+)
+_HT_WIN_TEMPLATE = _HT_RESULT_TEMPLATE.format(icon="✅", verdict="🎉 36' Bet WON")
+_HT_LOSS_TEMPLATE = _HT_RESULT_TEMPLATE.format(icon="❌", verdict="🔁 36' Bet LOST")
+
 # --- FILTER CONSTANTS (Kept) ---
-AMATEUR_KEYWORDS = [
+AMATEUR_KEYWORDS = (
     'amateur', 'youth', 'reserve', 'friendly', 'u23', 'u21', 'u19', 
     'liga de reservas', 'division b', 'm-league', 'liga pro','u17'
-]
+)
+# One C-level scan over the filter text instead of one `in` check per keyword
+_AMATEUR_RE = re.compile('|'.join(map(re.escape, AMATEUR_KEYWORDS)), re.IGNORECASE)
 
 # =========================================================
 # 📌 INITIALIZATION FUNCTIONS
@@ -81,7 +165,7 @@ def initialize_sofascore_client():
         logger.info("Sofascore client successfully initialized and service is ready.")
         return True
     except Exception as e:
-        logger.critical(f"FATAL: SofascoreClient failed to initialize. Error: {e}", exc_info=True)
+        logger.critical("FATAL: SofascoreClient failed to initialize. Error: %s", e, exc_info=True)
         SOFASCORE_CLIENT = None
         return False
 
@@ -94,6 +178,9 @@ def initialize_bot_services():
     if not initialize_sofascore_client():
         logger.critical("Bot cannot proceed. Sofascore client initialization failed.")
         return False
+
+    # 2. Restore bets that were still open when the bot last stopped
+    load_tracked_matches()
         
     logger.info("All bot services initialized successfully.")
     send_telegram("🚀 Football Betting Bot Initialized Successfully! Starting monitoring.")
@@ -101,56 +188,198 @@ def initialize_bot_services():
     
 def shutdown_bot():
     """Closes the Sofascore client resources gracefully. Crucial for Playwright stability."""
-    global SOFASCORE_CLIENT
+    global SOFASCORE_CLIENT, _STATE_DB
     if SOFASCORE_CLIENT:
         SOFASCORE_CLIENT.close()
         logger.info("Sofascore Client resources closed.")
+    if _STATE_DB is not None:
+        save_tracked_matches()
+        _STATE_DB.close()
+        _STATE_DB = None
+        logger.info("State database closed.")
+
+# =========================================================
+# 💾 STATE PERSISTENCE
+# =========================================================
+
+def load_tracked_matches():
+    """
+    Opens the state database (WAL mode) and restores LOCAL_TRACKED_MATCHES
+    from it, so a restart neither re-places a 36' bet nor misses its HT
+    resolution. On failure the bot keeps tracking in memory only.
+    """
+    global _STATE_DB
+    try:
+        _STATE_DB = sqlite3.connect(STATE_DB_PATH)
+        _STATE_DB.execute("PRAGMA journal_mode=WAL")
+        _STATE_DB.execute(
+            "CREATE TABLE IF NOT EXISTS tracked ("
+            "fixture_id INTEGER PRIMARY KEY, bet_placed INTEGER, bet_score TEXT, bet_status TEXT)"
+        )
+        rows = _STATE_DB.execute("SELECT fixture_id, bet_placed, bet_score, bet_status FROM tracked").fetchall()
+    except sqlite3.Error as e:
+        logger.error("Could not open state database %s, tracking in memory only: %s", STATE_DB_PATH, e)
+        _STATE_DB = None
+        return
+
+    # Restored matches get a fresh TTL; ones that never show up live again are evicted as usual
+    now = time.monotonic()
+    for fixture_id, bet_placed, bet_score, bet_status in rows:
+        row = (bool(bet_placed), bet_score, bet_status)
+        LOCAL_TRACKED_MATCHES[fixture_id] = MatchState(*row)
+        _TRACKED_MATCHES_LAST_SEEN[fixture_id] = now
+        _PERSISTED_STATE[fixture_id] = row
+    logger.info("Restored %d tracked matches from %s.", len(rows), STATE_DB_PATH)
+
+
+def save_tracked_matches():
+    """
+    Writes the changes to LOCAL_TRACKED_MATCHES since the last save in one
+    transaction. Called once per cycle, so the bet logic never waits on disk.
+    """
+    if _STATE_DB is None:
+        return
+
+    current = {
+        fixture_id: (state.bet_placed, state.bet_score, state.bet_status)
+        for fixture_id, state in LOCAL_TRACKED_MATCHES.items()
+    }
+    upserts = [(fixture_id, *row) for fixture_id, row in current.items() if _PERSISTED_STATE.get(fixture_id) != row]
+    deletes = [(fixture_id,) for fixture_id in _PERSISTED_STATE.keys() - current.keys()]
+    if not upserts and not deletes:
+        return
+
+    try:
+        with _STATE_DB:
+            _STATE_DB.executemany("INSERT OR REPLACE INTO tracked VALUES (?, ?, ?, ?)", upserts)
+            _STATE_DB.executemany("DELETE FROM tracked WHERE fixture_id = ?", deletes)
+    except sqlite3.Error as e:
+        # The in-memory state is still correct; the next cycle retries the same diff
+        logger.error("Could not persist tracked matches: %s", e)
+        return
+
+    _PERSISTED_STATE.clear()
+    _PERSISTED_STATE.update(current)
 
 # =========================================================
 # 🟢 AVERAGE GOALS & TELEGRAM FUNCTIONS
 # =========================================================
 
+def _get_cached_team_stats(team_id: int, tournament_id: int) -> Optional[TeamTournamentStats]:
+    """Returns the cached stats for the pair if they are younger than TEAM_STATS_CACHE_TTL."""
+    entry = _TEAM_STATS_CACHE.get((team_id, tournament_id))
+    if entry and time.monotonic() - entry[0] < TEAM_STATS_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _cache_team_stats(stats: TeamTournamentStats):
+    """Stores successfully parsed stats, evicting the oldest entry when the cache is full."""
+    key = (stats.team_id, stats.tournament_id)
+    _TEAM_STATS_CACHE.pop(key, None)
+    _TEAM_STATS_CACHE[key] = (time.monotonic(), stats)
+    if len(_TEAM_STATS_CACHE) > TEAM_STATS_CACHE_MAXSIZE:
+        del _TEAM_STATS_CACHE[next(iter(_TEAM_STATS_CACHE))]
+
+
 def _get_team_stats_safely(team_id: int, tournament_id: int) -> TeamTournamentStats:
     """
     Fetches, parses, and returns TeamTournamentStats, logging errors safely.
     Returns an empty TeamTournamentStats object if fetching fails.
     """
+    cached_stats = _get_cached_team_stats(team_id, tournament_id)
+    if cached_stats:
+        return cached_stats
+
     if not SOFASCORE_CLIENT:
         logger.error("Client not initialized. Cannot fetch team stats.")
         return TeamTournamentStats(team_id=team_id, tournament_id=tournament_id)
         
     raw_stats = SOFASCORE_CLIENT.get_team_tournament_stats(team_id, tournament_id)
     if raw_stats:
-        return parse_team_tournament_stats(team_id, tournament_id, raw_stats)
+        stats = parse_team_tournament_stats(team_id, tournament_id, raw_stats)
+        _cache_team_stats(stats)
+        return stats
     
-    logger.warning(f"Could not fetch raw stats for team {team_id} in tournament {tournament_id}. Returning empty stats.")
+    logger.warning("Could not fetch raw stats for team %s in tournament %s. Returning empty stats.", team_id, tournament_id)
     return TeamTournamentStats(team_id=team_id, tournament_id=tournament_id)
 
 
-def _get_average_goal_stats(event: Event) -> Dict[str, float]:
+def _prefetch_team_stats(events: List[Event]) -> Dict[Tuple[int, int], TeamTournamentStats]:
+    """
+    Fetches the stats of every (team_id, tournament_id) pair in the given events
+    in one concurrent batch, so each pair costs one request per cycle instead of
+    one blocking round-trip per lookup. Pairs still fresh in the TTL cache are
+    not re-fetched. Pairs that failed are left out; callers fall back to
+    _get_team_stats_safely for those.
+    """
+    if not SOFASCORE_CLIENT or not events:
+        return {}
+
+    # Reverse tournament -> teams index, so a team playing in several live
+    # fixtures of the same tournament is only looked up once
+    teams_by_tournament = defaultdict(set)
+    for event in events:
+        teams_by_tournament[event.tournament.id].update((event.home_team.id, event.away_team.id))
+
+    stats_map = {}
+    missing_pairs = []
+    for tournament_id, team_ids in teams_by_tournament.items():
+        for team_id in team_ids:
+            pair = (team_id, tournament_id)
+            cached_stats = _get_cached_team_stats(*pair)
+            if cached_stats:
+                stats_map[pair] = cached_stats
+            else:
+                missing_pairs.append(pair)
+
+    if not missing_pairs:
+        return stats_map
+
+    raw_stats_by_pair = SOFASCORE_CLIENT.get_team_tournament_stats_batch(missing_pairs)
+    for (team_id, tournament_id), raw_stats in raw_stats_by_pair.items():
+        if raw_stats:
+            stats = parse_team_tournament_stats(team_id, tournament_id, raw_stats)
+            _cache_team_stats(stats)
+            stats_map[(team_id, tournament_id)] = stats
+    return stats_map
+
+
+def _get_average_goal_stats(
+    event: Event, 
+    stats_map: Optional[Dict[Tuple[int, int], TeamTournamentStats]] = None
+) -> Dict[str, float]:
     """
     Calculates combined average goals and returns the stats.
     NOTE: This function performs CALCULATION only, not filtering.
+    Stats already fetched by _prefetch_team_stats are taken from stats_map.
     """
+    stats_map = stats_map or {}
+    tournament_id = event.tournament.id
+
     # Home Team Stats
-    home_stats = _get_team_stats_safely(
+    home_stats = stats_map.get((event.home_team.id, tournament_id)) or _get_team_stats_safely(
         team_id=event.home_team.id, 
-        tournament_id=event.tournament.id
+        tournament_id=tournament_id
     )
     
     # Away Team Stats
-    away_stats = _get_team_stats_safely(
+    away_stats = stats_map.get((event.away_team.id, tournament_id)) or _get_team_stats_safely(
         team_id=event.away_team.id, 
-        tournament_id=event.tournament.id
+        tournament_id=tournament_id
     )
     
     # Calculate the total average goals across both teams
     total_avg_goals = home_stats.total_average_goals + away_stats.total_average_goals
     
-    logger.info(
-        f"Avg Goal Calc: {event.home_team.name} vs {event.away_team.name} | "
-        f"Combined Avg: {total_avg_goals:.2f} (Min Ref: {MIN_TOTAL_AVERAGE_GOALS:.2f})"
-    )
+    # Runs for every bet candidate; skip the attribute lookups when INFO is off
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Avg Goal Calc: %s vs %s | Home Avg: %.2f | Away Avg: %.2f | Combined Avg: %.2f (Min Ref: %s)",
+            event.home_team.name, event.away_team.name,
+            home_stats.total_average_goals, away_stats.total_average_goals,
+            total_avg_goals, _MIN_GOALS_STR
+        )
 
     # Return the stats
     return {
@@ -160,193 +389,430 @@ def _get_average_goal_stats(event: Event) -> Dict[str, float]:
     }
 
 
-def send_telegram(msg, max_retries=3):
-    """Send Telegram message with retry mechanism"""
+def start_telegram_delivery(loop: asyncio.AbstractEventLoop):
+    """
+    Routes send_telegram through a queue drained by a sender task on the given
+    (running) event loop. Must be called from that loop; producing a message
+    then costs a thread-safe queue put instead of an HTTPS round-trip.
+    """
+    global _TELEGRAM_LOOP, _TELEGRAM_ASYNC_CLIENT, _TELEGRAM_QUEUE, _TELEGRAM_SENDER_TASK
+    _TELEGRAM_ASYNC_CLIENT = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(http2=True, retries=2), # Reconnects; HTTP errors are retried by send_telegram_async
+        timeout=10.0,
+    )
+    _TELEGRAM_QUEUE = asyncio.Queue()
+    _TELEGRAM_SENDER_TASK = loop.create_task(_telegram_sender())
+    _TELEGRAM_LOOP = loop
+
+
+async def stop_telegram_delivery():
+    """Delivers the messages still queued, then stops the sender task and releases the async client."""
+    global _TELEGRAM_LOOP, _TELEGRAM_ASYNC_CLIENT, _TELEGRAM_QUEUE, _TELEGRAM_SENDER_TASK
+    _TELEGRAM_LOOP = None
+    if _TELEGRAM_QUEUE is not None:
+        await _TELEGRAM_QUEUE.join()
+        _TELEGRAM_QUEUE = None
+    if _TELEGRAM_SENDER_TASK is not None:
+        _TELEGRAM_SENDER_TASK.cancel()
+        await asyncio.gather(_TELEGRAM_SENDER_TASK, return_exceptions=True)
+        _TELEGRAM_SENDER_TASK = None
+    if _TELEGRAM_ASYNC_CLIENT:
+        await _TELEGRAM_ASYNC_CLIENT.aclose()
+        _TELEGRAM_ASYNC_CLIENT = None
+
+
+async def _telegram_sender():
+    """
+    Consumer task: waits for a message, drains whatever else is already queued,
+    and sends the lot coalesced into as few Telegram messages as possible.
+    Batches are sent one after another, which keeps signals in order and
+    well under Telegram's per-chat rate limit.
+    """
+    while True:
+        items = [await _TELEGRAM_QUEUE.get()]
+        while not _TELEGRAM_QUEUE.empty():
+            items.append(_TELEGRAM_QUEUE.get_nowait())
+        batch = [msg for messages in items for msg in messages]
+        try:
+            for text in _coalesce_messages(batch):
+                await send_telegram_async(text)
+        except Exception as e:
+            logger.error("Telegram sender failed to deliver %s message(s): %s", len(batch), e, exc_info=True)
+        finally:
+            for _ in items:
+                _TELEGRAM_QUEUE.task_done()
+
+
+def _coalesce_messages(messages: List[str]) -> List[str]:
+    """Joins messages into as few texts as fit under TELEGRAM_BATCH_MAX_CHARS, keeping their order."""
+    texts: List[str] = []
+    batch: List[str] = []
+    batch_len = 0
+    for msg in messages:
+        added_len = len(msg) + (len(TELEGRAM_BATCH_SEPARATOR) if batch else 0)
+        if batch and batch_len + added_len > TELEGRAM_BATCH_MAX_CHARS:
+            texts.append(TELEGRAM_BATCH_SEPARATOR.join(batch))
+            batch, batch_len = [], 0
+            added_len = len(msg)
+        batch.append(msg)
+        batch_len += added_len
+
+    if batch:
+        texts.append(TELEGRAM_BATCH_SEPARATOR.join(batch))
+    return texts
+
+
+def _get_retry_after(response: httpx.Response, default: float) -> float:
+    """Reads the back-off Telegram requests on a 429 (Retry-After header or parameters.retry_after)."""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is None:
+        try:
+            retry_after = response.json().get('parameters', {}).get('retry_after')
+        except ValueError:
+            retry_after = None
+    try:
+        return float(retry_after) if retry_after is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
+async def send_telegram_async(msg, max_retries=3):
+    """Send Telegram message with retry mechanism; the backoff is awaited so the event loop keeps running"""
     if not TELEGRAM_TOKEN or not TELEGRAM_CHAT_ID:
-        logger.warning(f"Telegram credentials missing. Message not sent: {msg}")
+        logger.warning("Telegram credentials missing. Message not sent: %s", msg)
         return False
-        
-    url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/sendMessage"
+
     data = {'chat_id': TELEGRAM_CHAT_ID, 'text': msg, 'parse_mode': 'Markdown'} 
-    
+
     for attempt in range(max_retries):
+        delay = 2 ** attempt
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = await _TELEGRAM_ASYNC_CLIENT.post(_TELEGRAM_SEND_URL, data=data)
             if response.status_code == 200:
                 return True
             else:
-                logger.error(f"Telegram error (attempt {attempt + 1}): {response.status_code} - {response.text}")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network Error sending Telegram message (attempt {attempt + 1}): {e}")
-        
+                logger.error("Telegram error (attempt %s): %s - %s", attempt + 1, response.status_code, response.text)
+                if response.status_code == 429:
+                    # Rate limited: wait exactly as long as Telegram asks instead of guessing
+                    delay = _get_retry_after(response, delay)
+        except httpx.HTTPError as e:
+            logger.error("Network Error sending Telegram message (attempt %s): %s", attempt + 1, e)
+
         if attempt < max_retries - 1:
-            time.sleep(2 ** attempt)
-    
+            await asyncio.sleep(delay)
+
     return False
 
+
+def send_telegram(msg):
+    """
+    Send Telegram message. The message is queued for the sender task started by
+    start_telegram_delivery() and this returns True once it is queued.
+    """
+    return _send_telegram_batch([msg])
+
+
+def _send_telegram_batch(messages: List[str]) -> bool:
+    """
+    Hands messages to the sender task as one queue item, so they are joined
+    together. All sends (retries, 429 back-off) go through send_telegram_async.
+    """
+    if not TELEGRAM_TOKEN or not TELEGRAM_CHAT_ID:
+        logger.warning("Telegram credentials missing. Message(s) not sent: %s", messages)
+        return False
+
+    if not _telegram_delivery_active():
+        logger.error("Telegram delivery is not running (start_telegram_delivery). Message(s) not sent: %s", messages)
+        return False
+
+    _TELEGRAM_LOOP.call_soon_threadsafe(_TELEGRAM_QUEUE.put_nowait, messages)
+    return True
+
+
+def _telegram_delivery_active() -> bool:
+    """True while start_telegram_delivery()'s sender task is consuming the queue."""
+    loop = _TELEGRAM_LOOP
+    return loop is not None and _TELEGRAM_QUEUE is not None and loop.is_running()
+
+
+def queue_telegram(msg):
+    """Queue a signal to be sent with the other messages of this cycle by flush_telegram()."""
+    _PENDING_TELEGRAM_MESSAGES.append(msg)
+
+
+def flush_telegram():
+    """
+    Sends all queued messages, joined into as few Telegram messages as fit
+    under TELEGRAM_BATCH_MAX_CHARS. A burst of N signals costs one POST
+    instead of N and stays clear of Telegram's per-chat rate limit.
+
+    The whole batch is handed over in one piece, so the sender task never
+    sees (and posts) just part of it.
+    """
+    if not _PENDING_TELEGRAM_MESSAGES:
+        return
+
+    messages = _PENDING_TELEGRAM_MESSAGES[:]
+    _PENDING_TELEGRAM_MESSAGES.clear()
+
+    _send_telegram_batch(messages)
+
 # =========================================================
 # 🏃 CORE LOGIC FUNCTIONS
 # =========================================================
 
 def get_live_matches():
-    """Fetch ONLY live matches using the Sofascore client."""
+    """
+    Fetch ONLY live matches using the Sofascore client.
+
+    Callers within LIVE_EVENTS_CACHE_TTL of the last successful fetch share its
+    result instead of each hitting Sofascore. Failed fetches are not cached.
+    Only called on main.py's single bot thread, so the cache needs no lock.
+    """
+    global _LIVE_EVENTS_CACHE
     if not SOFASCORE_CLIENT:
         logger.error("Sofascore client is not initialized.")
         return []
+    if _LIVE_EVENTS_CACHE and time.monotonic() - _LIVE_EVENTS_CACHE[0] < LIVE_EVENTS_CACHE_TTL:
+        logger.info("Reusing %d live matches fetched within the last %ds.", len(_LIVE_EVENTS_CACHE[1]), LIVE_EVENTS_CACHE_TTL)
+        return _LIVE_EVENTS_CACHE[1]
     try:
         live_events = SOFASCORE_CLIENT.get_events(live=True) 
-        logger.info(f"Fetched {len(live_events)} live matches.")
-        return live_events
+        logger.info("Fetched %d live matches.", len(live_events))
     except Exception as e:
-        logger.error(f"Sofascore API Error fetching live matches: {e}")
+        logger.error("Sofascore API Error fetching live matches: %s", e)
         return []
+    _LIVE_EVENTS_CACHE = (time.monotonic(), live_events)
+    return live_events
 
 
-def place_regular_bet(state, fixture_id, score, match_info, avg_goal_stats: Dict[str, float]):
+def place_regular_bet(
+    state: MatchState, fixture_id: int, score, match_info, avg_goal_stats: Optional[Dict[str, float]] = None
+):
     """
     Handles placing the initial 36' bet and storing its data locally.
-    Includes avg goal stats in the Telegram message.
+    Includes avg goal stats in the Telegram message; they are only needed
+    (and only fetched by the caller) when the score is in REGULAR_BET_SCORES.
     """
     
     # Check local state (LOCAL_TRACKED_MATCHES) for an *unresolved* bet
-    if LOCAL_TRACKED_MATCHES.get(fixture_id, {}).get('bet_status') == 'unresolved':
-        logger.info(f"Regular bet already tracked as 'unresolved' for fixture {fixture_id}. Skipping placement.")
+    tracked = LOCAL_TRACKED_MATCHES.get(fixture_id)
+    if tracked and tracked.bet_status == 'unresolved':
+        logger.info("Regular bet already tracked as 'unresolved' for fixture %s. Skipping placement.", fixture_id)
         return
 
-    if score in ['1-1', '2-2', '3-3']:
-        state['36_bet_placed'] = True
-        state['36_score'] = score
-        state['bet_status'] = 'unresolved' 
+    if score in REGULAR_BET_SCORES:
+        state.bet_placed = True
+        state.bet_score = score
+        state.bet_status = 'unresolved' 
         LOCAL_TRACKED_MATCHES[fixture_id] = state 
 
-        message = (
-            f"⏱️ **36' - {match_info['match_name']}**\n"
-            f"🌍 {match_info['country']} | 🏆 {match_info['league_name']}\n"
-            f"🔢 Score: {score}\n"
-            f"🎯 Correct Score Bet Placed for Half Time\n\n"
-            
-            f"📊 *Average Goal Stats* (Min Ref: {MIN_TOTAL_AVERAGE_GOALS:.2f}):\n"
-            f"• *Home Avg*: {avg_goal_stats['home_avg']:.2f}\n"
-            f"• *Away Avg*: {avg_goal_stats['away_avg']:.2f}\n"
-            f"• *Total Avg*: {avg_goal_stats['total_avg']:.2f}"
+        message = _REGULAR_BET_TEMPLATE.format(
+            match_name=match_info['match_name'],
+            country=match_info['country'],
+            league_name=match_info['league_name'],
+            score=score,
+            min_goals=_MIN_GOALS_STR,
+            home_avg=avg_goal_stats['home_avg'],
+            away_avg=avg_goal_stats['away_avg'],
+            total_avg=avg_goal_stats['total_avg'],
         )
-        send_telegram(message)
+        queue_telegram(message)
     else:
-        state['36_bet_placed'] = True
+        state.bet_placed = True
         LOCAL_TRACKED_MATCHES[fixture_id] = state 
 
 
-def check_ht_result(state, fixture_id, score, match_info):
+def check_ht_result(state: MatchState, fixture_id: int, score, match_info):
     """Checks the result of locally tracked bets at halftime."""
     
     local_bet_data = LOCAL_TRACKED_MATCHES.get(fixture_id)
 
-    if local_bet_data and local_bet_data.get('bet_status') == 'unresolved':
+    if local_bet_data and local_bet_data.bet_status == 'unresolved':
         
         current_score = score
-        bet_score = local_bet_data.get('36_score', 'N/A')
+        bet_score = local_bet_data.bet_score or 'N/A'
         outcome = 'win' if current_score == bet_score else 'loss'
             
         country_name = match_info['country']
         league_name = match_info['league_name']
         
-        if outcome == 'win':
-            message = (
-                f"✅ **HT Result: {match_info['match_name']}**\n"
-                f"🌍 {country_name} | 🏆 {league_name}\n"
-                f"🔢 HT Score: **{current_score}**\n"
-                f"🎯 Bet Score: **{bet_score}**\n"
-                f"🎉 36' Bet WON"
-            )
-        else:
-            message = (
-                f"❌ **HT Result: {match_info['match_name']}**\n"
-                f"🌍 {country_name} | 🏆 {league_name}\n"
-                f"🔢 HT Score: **{current_score}**\n"
-                f"🎯 Bet Score: **{bet_score}**\n"
-                f"🔁 36' Bet LOST"
-            )
-            
-        send_telegram(message)
+        message = (_HT_WIN_TEMPLATE if outcome == 'win' else _HT_LOSS_TEMPLATE).format(
+            match_name=match_info['match_name'],
+            country=country_name,
+            league_name=league_name,
+            ht_score=current_score,
+            bet_score=bet_score,
+        )
+        queue_telegram(message)
         
-        local_bet_data['bet_status'] = 'resolved'
+        local_bet_data.bet_status = 'resolved'
         LOCAL_TRACKED_MATCHES[fixture_id] = local_bet_data
-        logger.info(f"Bet {fixture_id} resolved as {outcome} and marked locally.")
+        logger.info("Bet %s resolved as %s and marked locally.", fixture_id, outcome)
     
 
-def process_live_match(match: Event):
+@functools.lru_cache(maxsize=64)
+def _normalize_status(status_description: str) -> str:
     """
-    Processes a single live match, calculating stats and checking betting conditions.
+    Maps a raw Sofascore status description to one of the bot's status codes.
+    The set of descriptions is small and closed, so after the first cycles
+    every call is a cache hit.
     """
-    fixture_id = str(match.id) 
-    
-    # 0. Calculate Average Goals Stats (NO FILTER APPLIED)
-    avg_goal_stats = _get_average_goal_stats(match)
-    
-    match_name = f"{match.home_team.name} vs {match.away_team.name}"
+    status_description = status_description.upper()
+    for fragment, status in _STATUS_MAP.items():
+        if fragment in status_description:
+            return status
+    return status_description if status_description in STATUS_LIVE else 'N/A'
+
+
+def _get_match_status(match: Event) -> str:
+    """Normalizes the Sofascore status description to one of the bot's status codes."""
+    return _normalize_status(match.status.description)
+
+
+def _is_amateur_match(match: Event) -> bool:
+    """
+    AMATEUR TOURNAMENT FILTER LOGIC. The verdict is cached per event id, so the
+    filter text is only built and scanned the first time a match is seen.
+    """
+    is_amateur = _AMATEUR_FILTER_CACHE.get(match.id)
+    if is_amateur is not None:
+        return is_amateur
 
-    # 1. AMATEUR TOURNAMENT FILTER LOGIC (RETAINED)
     tournament = match.tournament
-    category_name = tournament.category.name if hasattr(tournament, 'category') and tournament.category else ''
+    category = getattr(tournament, 'category', None)
+    category_name = category.name if category else ''
     
     full_filter_text = (
         f"{tournament.name} "
         f"{category_name} "
         f"{match.home_team.name} "
         f"{match.away_team.name}"
-    ).lower()
+    )
 
-    if any(keyword in full_filter_text for keyword in AMATEUR_KEYWORDS):
-        cleaned_text = full_filter_text.replace('\n', ' ')
-        logger.info(f"Skipping amateur/youth league based on keyword found in: {cleaned_text}")
-        return
-    # END FILTERS
+    is_amateur = bool(_AMATEUR_RE.search(full_filter_text))
+    if is_amateur and logger.isEnabledFor(logging.INFO):
+        logger.info("Skipping amateur/youth league based on keyword found in: %s", full_filter_text.replace('\n', ' '))
+
+    _AMATEUR_FILTER_CACHE[match.id] = is_amateur
+    return is_amateur
+
+
+def _get_score(match: Event) -> str:
+    """Formats the current score as 'home-away'."""
+    return f"{match.home_score.current}-{match.away_score.current}"
 
-    minute = match.total_elapsed_minutes 
-    status_description = match.status.description.upper()
-    status = 'N/A' 
-    
-    if '1ST HALF' in status_description: status = '1H'
-    elif '2ND HALF' in status_description: status = '2H'
-    elif 'HALFTIME' in status_description: status = STATUS_HALFTIME
-    elif 'FINISHED' in status_description or 'ENDED' in status_description or 'CANCELLED' in status_description: status = 'FT'
-    elif status_description in STATUS_LIVE: status = status_description
-
-    home_goals = match.home_score.current
-    away_goals = match.away_score.current
-    score = f"{home_goals}-{away_goals}"
-    
-    if status.upper() not in STATUS_LIVE and status.upper() != STATUS_HALFTIME: return
-    
-    # Get or create local state
-    state = LOCAL_TRACKED_MATCHES.get(fixture_id) or {
-        '36_bet_placed': False,
-        '36_score': None,
-        'bet_status': 'none' # 'none', 'unresolved', 'resolved'
-    }
-    LOCAL_TRACKED_MATCHES[fixture_id] = state
 
-    match_info = {
-        'match_name': match_name,
-        'league_name': tournament.name if hasattr(match, 'tournament') else 'N/A',
-        'country': tournament.category.name if hasattr(match, 'tournament') and hasattr(tournament, 'category') else 'N/A', 
-        'league_id': tournament.id if hasattr(match, 'tournament') else 'N/A'
+def _build_match_info(match: Event) -> Dict[str, Any]:
+    """
+    Builds the display info used in Telegram messages. Only the bet and HT
+    branches need it, so most matches in a cycle never allocate one; the
+    36' bet and its HT resolution share the cached copy.
+    """
+    match_info = _MATCH_INFO_CACHE.get(match.id)
+    if match_info is not None:
+        return match_info
+
+    tournament = getattr(match, 'tournament', None)
+    category = getattr(tournament, 'category', None) if tournament else None
+    match_info = _MATCH_INFO_CACHE[match.id] = {
+        'match_name': f"{match.home_team.name} vs {match.away_team.name}",
+        'league_name': tournament.name if tournament else 'N/A',
+        'country': category.name if category else 'N/A', 
+        'league_id': tournament.id if tournament else 'N/A'
     }
-        
-    # 2. Bet Placement Check
-    if status.upper() == '1H' and minute in MINUTES_REGULAR_BET and not state.get('36_bet_placed'):
-        # Pass the calculated stats to the bet placement function
-        place_regular_bet(state, fixture_id, score, match_info, avg_goal_stats)
-        
-    # 3. Halftime Resolution Check
-    elif status.upper() == STATUS_HALFTIME and state.get('bet_status') == 'unresolved':
-        check_ht_result(state, fixture_id, score, match_info)
-        
-    # 4. Cleanup (Finished matches)
-    if status in STATUS_FINISHED and state.get('bet_status') in ['none', 'resolved']:
-        if fixture_id in LOCAL_TRACKED_MATCHES:
+    return match_info
+
+
+def _triage_live_matches(live_matches: List[Event]) -> Tuple[List[Event], List[Event]]:
+    """
+    Single pass over the live feed. Returns the matches process_live_match has
+    something to do for (in the 36' window, or already tracked), and the subset
+    of those that are about to place a bet and need average goal stats.
+    """
+    actionable: List[Event] = []
+    bet_candidates: List[Event] = []
+    for match in live_matches:
+        state = LOCAL_TRACKED_MATCHES.get(match.id)
+        in_bet_window = _get_match_status(match) == '1H' and match.total_elapsed_minutes in MINUTES_REGULAR_BET
+        if not in_bet_window and state is None:
+            continue
+        actionable.append(match)
+        if (
+            in_bet_window
+            and not (state and state.bet_placed)
+            and _get_score(match) in REGULAR_BET_SCORES
+            and not _is_amateur_match(match)
+        ):
+            bet_candidates.append(match)
+    return actionable, bet_candidates
+
+
+def process_live_match(
+    match: Event, 
+    stats_map: Optional[Dict[Tuple[int, int], TeamTournamentStats]] = None
+):
+    """
+    Processes a single live match, checking betting conditions.
+    Checks run cheapest first: status, then local state, then the amateur
+    filter; the average goal stats are only looked up when a bet is
+    actually about to be placed.
+    """
+    fixture_id = match.id 
+    status = _get_match_status(match)
+    state = LOCAL_TRACKED_MATCHES.get(fixture_id)
+
+    # 1. Cleanup (Finished matches); an unresolved bet is kept until the TTL eviction
+    if status in STATUS_FINISHED:
+        if state is not None and state.bet_status in ('none', 'resolved'):
             del LOCAL_TRACKED_MATCHES[fixture_id]
-            logger.info(f"Cleaned up local tracking for finished fixture {fixture_id}.")
+            _TRACKED_MATCHES_LAST_SEEN.pop(fixture_id, None)
+            logger.info("Cleaned up local tracking for finished fixture %s.", fixture_id)
+        return
+
+    if status not in STATUS_LIVE and status != STATUS_HALFTIME: return
+
+    if state is not None:
+        _TRACKED_MATCHES_LAST_SEEN[fixture_id] = time.monotonic()
+
+    # Fast reject: only an open 36' window or an unresolved bet at HT needs any work
+    needs_bet = status == '1H' and match.total_elapsed_minutes in MINUTES_REGULAR_BET and not (state and state.bet_placed)
+    needs_ht_result = status == STATUS_HALFTIME and state is not None and state.bet_status == 'unresolved'
+    if not needs_bet and not needs_ht_result:
+        return
+
+    # 2. AMATEUR TOURNAMENT FILTER LOGIC (RETAINED)
+    if _is_amateur_match(match):
+        return
+    # END FILTERS
+
+    # 3. Bet Placement Check
+    if needs_bet:
+        if state is None:
+            state = LOCAL_TRACKED_MATCHES[fixture_id] = MatchState()
+            _TRACKED_MATCHES_LAST_SEEN[fixture_id] = time.monotonic()
+        score = _get_score(match)
+        # Average goal stats only go into the bet message, so skip them for non-draw scores
+        avg_goal_stats = _get_average_goal_stats(match, stats_map) if score in REGULAR_BET_SCORES else None
+        place_regular_bet(state, fixture_id, score, _build_match_info(match), avg_goal_stats)
+        
+    # 4. Halftime Resolution Check
+    else:
+        check_ht_result(state, fixture_id, _get_score(match), _build_match_info(match))
+
+
+def _evict_stale_tracked_matches():
+    """
+    Drops tracked matches that have not been seen live for TRACKED_MATCH_TTL.
+    The FT cleanup above only runs if the finished status is ever observed,
+    which is not the case when the API drops an event from the live feed.
+    """
+    expired_before = time.monotonic() - TRACKED_MATCH_TTL
+    for fixture_id, last_seen in list(_TRACKED_MATCHES_LAST_SEEN.items()):
+        if last_seen < expired_before:
+            del _TRACKED_MATCHES_LAST_SEEN[fixture_id]
+            LOCAL_TRACKED_MATCHES.pop(fixture_id, None)
+            logger.info("Evicted stale local tracking for fixture %s.", fixture_id)
 
 
 def run_bot_cycle():
@@ -358,27 +824,25 @@ def run_bot_cycle():
         return
         
     live_matches = get_live_matches() 
+
+    # Forget filter verdicts and display info for events that are no longer live
+    live_ids = {match.id for match in live_matches}
+    for event_id in _AMATEUR_FILTER_CACHE.keys() - live_ids:
+        del _AMATEUR_FILTER_CACHE[event_id]
+    for event_id in _MATCH_INFO_CACHE.keys() - live_ids:
+        del _MATCH_INFO_CACHE[event_id]
+
+    # Only matches about to place a bet need the (network-bound) stats
+    actionable, bet_candidates = _triage_live_matches(live_matches)
+    stats_map = _prefetch_team_stats(bet_candidates)
     
-    for match in live_matches:
-        process_live_match(match)
-    
-    logger.info(f"Bot cycle completed. Currently tracking {len(LOCAL_TRACKED_MATCHES)} matches locally.")
+    try:
+        for match in actionable:
+            process_live_match(match, stats_map)
+    finally:
+        flush_telegram()
 
-if __name__ == "__main__":
-    if initialize_bot_services():
-        try:
-            if not SOFASCORE_CLIENT:
-                raise Exception("Sofascore Client not available after initialization.")
-            
-            while True:
-                run_bot_cycle()
-                logger.info(f"Sleeping for {SLEEP_TIME} seconds...")
-                time.sleep(SLEEP_TIME)
-        except KeyboardInterrupt:
-            logger.info("Bot shutting down due to user interrupt.")
-        except Exception as e:
-            logger.critical(f"FATAL UNHANDLED ERROR IN MAIN LOOP: {e}", exc_info=True)
-            send_telegram(f"❌ CRITICAL BOT ERROR: {e}. Check logs immediately!")
-        finally:
-            shutdown_bot()
-            logger.info("Bot terminated.")
+    _evict_stale_tracked_matches()
+    save_tracked_matches()
+    
+    logger.info("Bot cycle completed. Currently tracking %d matches locally.", len(LOCAL_TRACKED_MATCHES))
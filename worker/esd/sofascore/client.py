@@ -5,7 +5,7 @@ Sofascore client module
 """
 
 import logging
-from typing import Optional, Dict, Any # Keep 'Optional', 'Dict', 'Any' for type hints
+from typing import Optional, Dict, Any, Iterable, Tuple # Keep 'Optional', 'Dict', 'Any' for type hints
 
 from .service import SofascoreService
 from .types import (
@@ -26,13 +26,15 @@ class SofascoreClient:
     A client to interact with the SofaScore service.
     """
 
-    def __init__(self, browser_path: str = None):
+    def __init__(self, browser_path: str = None, max_connections: int = 10):
         """
         Initializes the Sofascore client.
+        max_connections sizes the service's pool for concurrent API fetches.
         """
         self.logger = logging.getLogger(__name__)
         self.service: Optional[SofascoreService] = None # Use Optional for clarity
         self.browser_path = browser_path
+        self.max_connections = max_connections
         self.__initialized = False
         self.logger.info("SofascoreClient initialized (service pending).")
 
@@ -41,7 +43,7 @@ class SofascoreClient:
         Explicitly initializes the underlying service and resources.
         """
         if self.service is None:
-            self.service = SofascoreService(self.browser_path)
+            self.service = SofascoreService(self.browser_path, self.max_connections)
             self.__initialized = True
             self.logger.info("SofascoreService successfully initialized.")
         else:
@@ -103,6 +105,17 @@ class SofascoreClient:
             
         return self.service.get_event(event_id)
     
+    def get_events_by_ids(self, event_ids: Iterable[int]) -> Dict[int, Optional[Event]]:
+        """
+        Get the event information for many events in one concurrent fan-out.
+        Events that failed map to None.
+        """
+        if not self.service:
+            self.logger.error("Service not initialized. Cannot get events.")
+            return {}
+
+        return self.service.get_events_by_ids(event_ids)
+
     def get_player(self, player_id: int) -> Optional[Player]:
         """
         Get the player information.
@@ -128,3 +141,16 @@ class SofascoreClient:
             
         # The service returns the raw dictionary data
         return self.service.get_team_tournament_stats(team_id, tournament_id)
+
+    def get_team_tournament_stats_batch(
+        self, pairs: Iterable[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], Optional[Dict[str, Any]]]:
+        """
+        Get the raw season statistics for many (team_id, tournament_id) pairs
+        in one concurrent fan-out. Pairs that failed map to None.
+        """
+        if not self.service:
+            self.logger.error("Service not initialized. Cannot get team stats.")
+            return {}
+
+        return self.service.get_team_tournament_stats_batch(pairs)
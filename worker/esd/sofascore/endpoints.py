@@ -1,10 +1,22 @@
 # esd/sofascore/endpoints.py
 
+import functools
+from typing import Iterable, Tuple
+from urllib.parse import urlencode
+
+
 class SofascoreEndpoints:
     """
     Manages all endpoint URLs for the Sofascore API.
     """
     
+    # The templates below are class attributes; instances only carry the
+    # prefixes precomputed in __init__, so they need no __dict__
+    __slots__ = ("_team_prefix",)
+
+    # Path segment for paged event lists, indexed by the boolean `upcoming`
+    EVENTS_DIRECTION = ("last", "next")
+
     # --- BASE URLS ---
     BASE_URL = "https://api.sofascore.com/api/v1/"
     EVENT_BASE_URL = BASE_URL + "event/{event_id}/"
@@ -39,10 +51,8 @@ class SofascoreEndpoints:
     
     team_endpoint = TEAM_BASE_URL
     team_players_endpoint = TEAM_BASE_URL + "players"
+    # {upcoming} takes EVENTS_DIRECTION[upcoming]: "last" for past events, "next" for upcoming ones
     team_events_endpoint = TEAM_BASE_URL + "events/{upcoming}/{page}"
-    
-    # NEW: Endpoint for fetching team stats (used for goal average)
-    team_tournament_stats_endpoint_template = TEAM_BASE_URL + "unique-tournament/{tournament_id}/statistics"
 
     # --- TOURNAMENT/LEAGUE ENDPOINTS ---
     
@@ -56,20 +66,42 @@ class SofascoreEndpoints:
 
     # --- SEARCH ENDPOINTS ---
     
-    search_endpoint_template = BASE_URL + "search?q={query}&entity={entity_type}"
+    search_endpoint_base = BASE_URL + "search"
     
+    def __init__(self):
+        """
+        Precomputes the URL prefixes used by the helper methods, so the
+        per-call work is plain concatenation instead of re-parsing a keyword
+        template.
+        """
+        self._team_prefix = self.BASE_URL + "team/"
+
     # --- HELPER METHODS ---
 
     def team_tournament_stats_endpoint(self, team_id: int, tournament_id: int) -> str:
         """Helper to format the team tournament stats URL."""
-        return self.team_tournament_stats_endpoint_template.format(
-            team_id=team_id, 
-            tournament_id=tournament_id
-        )
+        return self.team_tournament_stats_endpoints(((team_id, tournament_id),))[0]
+
+    def team_tournament_stats_endpoints(self, pairs: Iterable[Tuple[int, int]]) -> list[str]:
+        """Helper to format the team tournament stats URLs for many (team_id, tournament_id) pairs at once."""
+        prefix = self._team_prefix
+        return [
+            prefix + str(team_id) + "/unique-tournament/" + str(tournament_id) + "/statistics"
+            for team_id, tournament_id in pairs
+        ]
 
     def search_endpoint(self, query: str, entity_type: str) -> str:
-        """Helper to format the search URL."""
-        return self.search_endpoint_template.format(
-            query=query, 
-            entity_type=entity_type
-        )
+        """
+        Helper to format the search URL. The query is URL-encoded, so spaces,
+        '&' and non-ASCII names produce a valid (and stable) URL.
+        """
+        return self.search_endpoint_base + "?" + urlencode({"q": query, "entity": entity_type})
+
+
+@functools.lru_cache(maxsize=None)
+def get_endpoints() -> SofascoreEndpoints:
+    """
+    Returns the shared SofascoreEndpoints instance. It holds no per-request
+    state, so every service can reuse the one built (and precomputed) first.
+    """
+    return SofascoreEndpoints()
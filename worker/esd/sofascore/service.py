@@ -5,17 +5,24 @@ Sofascore service module
 """
 
 from __future__ import annotations
+import asyncio
+import functools
 import playwright
 import os
 import logging
 import subprocess
 import sys
-from typing import Optional, Dict, Any 
+import httpx
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for closing the pooled async client, so close() can never hang
+ASYNC_CLOSE_TIMEOUT = 5.0
 
 # Add browser installation check
 def install_playwright_browsers():
     """Install Playwright browsers if missing"""
-    logger = logging.getLogger(__name__)
     try:
         logger.info("Checking Playwright browser installation...")
         # Try to install browsers
@@ -27,10 +34,10 @@ def install_playwright_browsers():
             logger.info("Playwright browsers installed successfully")
             return True
         else:
-            logger.error(f"Browser installation failed: {result.stderr}")
+            logger.error("Browser installation failed: %s", result.stderr)
             return False
     except Exception as e:
-        logger.error(f"Browser installation error: {e}")
+        logger.error("Browser installation error: %s", e)
         return False
 
 # Install browsers before anything else (Keep this outside the class for startup efficiency)
@@ -38,8 +45,8 @@ def install_playwright_browsers():
 # install_playwright_browsers() 
 
 # Corrected relative imports for the local package structure
-from ..utils import get_json, get_today
-from .endpoints import SofascoreEndpoints
+from ..utils import HTTP_CONNECT_RETRIES, get_json, get_json_async, get_today, run_async
+from .endpoints import get_endpoints
 from .types import (
     Event,
     parse_event,
@@ -85,19 +92,61 @@ from .types import (
 )
 
 
+def _normalize_tournament_season_ids(method):
+    """
+    Lets a service method take a Tournament/Season object or its plain id for
+    tournament_id/season_id; the method body always receives the ids.
+    """
+    @functools.wraps(method)
+    def wrapper(self, tournament_id, season_id, *args, **kwargs):
+        if isinstance(tournament_id, Tournament):
+            tournament_id = tournament_id.id
+        if isinstance(season_id, Season):
+            season_id = season_id.id
+        return method(self, tournament_id, season_id, *args, **kwargs)
+    return wrapper
+
+
+# search() result parsers, by requested EntityType and (for EntityType.ALL)
+# by the "type" of each result; unknown types are returned as-is.
+_SEARCH_SPECIFIC_PARSERS = {
+    EntityType.TEAM: parse_team,
+    EntityType.PLAYER: parse_player,
+    EntityType.EVENT: parse_event,
+    EntityType.TOURNAMENT: parse_tournament,
+}
+_SEARCH_TYPE_PARSERS = {
+    "team": parse_team,
+    "player": parse_player,
+    "event": parse_events,
+    "uniqueTournament": parse_tournament,
+}
+
+
+def _identity(data):
+    return data
+
+
 class SofascoreService:
     """
     A class to represent the SofaScore service.
     """
 
-    def __init__(self, browser_path: str = None):
+    def __init__(self, browser_path: str = None, max_connections: int = 10):
         """
         Initializes the SofaScore service.
+
+        Args:
+            browser_path (str): Path to the browser executable.
+            max_connections (int): Connection pool size (and requests in flight)
+                for the concurrent direct API fetches.
         """
-        self.logger = logging.getLogger(__name__)
         self.browser_path = browser_path
-        self.endpoints = SofascoreEndpoints()
+        self.max_connections = max_connections
+        self.endpoints = get_endpoints()
         self.playwright = self.browser = self.page = None
+        # Pooled client for the direct API fan-outs; created on the run_async loop
+        self.__async_client: Optional[httpx.AsyncClient] = None
         self.__init_playwright()
 
     def __init_playwright(self):
@@ -108,7 +157,7 @@ class SofascoreService:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                self.logger.info(f"Initializing Playwright (attempt {attempt + 1})")
+                logger.info("Initializing Playwright (attempt %s)", attempt + 1)
                 self.playwright = playwright.sync_api.sync_playwright().start()
                 
                 # Browser launch options for Railway/cloud environments
@@ -131,11 +180,11 @@ class SofascoreService:
                 # Only use executable_path if provided and exists
                 if self.browser_path and os.path.exists(self.browser_path):
                     launch_options['executable_path'] = self.browser_path
-                    self.logger.info(f"Using browser at: {self.browser_path}")
+                    logger.info("Using browser at: %s", self.browser_path)
                     self.browser = self.playwright.chromium.launch(**launch_options)
                 else:
                     # Use Playwright's bundled Chromium (works on Railway)
-                    self.logger.info("Using Playwright's bundled Chromium")
+                    logger.info("Using Playwright's bundled Chromium")
                     self.browser = self.playwright.chromium.launch(**launch_options)
                 
                 # Create page with better timeout settings
@@ -143,15 +192,15 @@ class SofascoreService:
                 self.page.set_default_timeout(30000)
                 self.page.set_default_navigation_timeout(30000)
                 
-                self.logger.info("Playwright initialized successfully")
+                logger.info("Playwright initialized successfully")
                 return
                 
             except Exception as exc:
-                self.logger.error(f"Playwright initialization failed (attempt {attempt + 1}): {str(exc)}")
+                logger.error("Playwright initialization failed (attempt %s): %s", attempt + 1, exc)
                 
                 # Try to install browsers if they're missing
                 if "Executable doesn't exist" in str(exc) and attempt == 0:
-                    self.logger.info("Attempting to install missing browsers...")
+                    logger.info("Attempting to install missing browsers...")
                     install_playwright_browsers()
                     continue
                     
@@ -167,6 +216,13 @@ class SofascoreService:
         Close the browser and playwright instances.
         """
         try:
+            if self.__async_client is not None:
+                # While the interpreter is finalizing, the esd-async loop thread is
+                # already frozen and would never run aclose(); the process exit
+                # releases the connections instead.
+                if not sys.is_finalizing():
+                    run_async(self.__async_client.aclose(), timeout=ASYNC_CLOSE_TIMEOUT)
+                self.__async_client = None
             if self.page:
                 self.page.close()
                 self.page = None
@@ -176,9 +232,9 @@ class SofascoreService:
             if self.playwright:
                 self.playwright.stop()
                 self.playwright = None
-            self.logger.info("Playwright resources closed successfully")
+            logger.info("Playwright resources closed successfully")
         except Exception as exc:
-            self.logger.error(f"Failed to close browser: {str(exc)}")
+            logger.error("Failed to close browser: %s", exc)
             
     def __del__(self):
         """
@@ -206,9 +262,91 @@ class SofascoreService:
             return raw_data 
             
         except Exception as exc:
-            self.logger.error(f"Failed to get team tournament stats for team {team_id} in tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get team tournament stats for team %s in tournament %s: %s", team_id, tournament_id, exc)
             return None
 
+    def get_team_tournament_stats_batch(
+        self, pairs: Iterable[Tuple[int, int]], max_concurrency: Optional[int] = None
+    ) -> Dict[Tuple[int, int], Optional[Dict[str, Any]]]:
+        """
+        Get the season statistics for many (team_id, tournament_id) pairs concurrently.
+
+        The requests are fanned out over the service's long-lived pooled
+        httpx.AsyncClient (direct API path), so the wall time is roughly one
+        round-trip instead of one per pair. Pairs the direct path fails for are
+        retried through the page; pairs that failed both ways map to None.
+
+        Args:
+            pairs (Iterable[Tuple[int, int]]): The (team_id, tournament_id) pairs.
+            max_concurrency (Optional[int]): Maximum number of requests in flight
+                (defaults to the service's max_connections).
+
+        Returns:
+            Dict[Tuple[int, int], Optional[Dict[str, Any]]]: Raw JSON data per pair.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+        urls = self.endpoints.team_tournament_stats_endpoints(pairs)
+        results = self.__get_json_many(urls, max_concurrency or self.max_connections)
+
+        stats = {}
+        for (team_id, tournament_id), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to get team tournament stats for team %s in tournament %s: %s", team_id, tournament_id, result)
+                result = None
+            stats[(team_id, tournament_id)] = result
+        return stats
+
+    async def __fetch_json_many(self, urls: list[str], max_concurrency: int) -> list[Any]:
+        """
+        Fetch many direct API URLs concurrently over the service's pooled client.
+        Results are in the order of urls; a failed request yields its exception.
+        """
+        client = self.__get_async_client()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await get_json_async(client, url)
+
+        return await asyncio.gather(*map(fetch, urls), return_exceptions=True)
+
+    def __get_json_many(self, urls: list[str], max_concurrency: int) -> list[Any]:
+        """
+        Fetch many URLs concurrently on the direct API path, then retry each failed
+        URL through get_json on the Playwright page, since the API firewall may
+        answer plain HTTP clients with 403. Results are in the order of urls; a
+        URL that failed both ways yields its exception.
+        """
+        results = run_async(self.__fetch_json_many(urls, max_concurrency))
+        for index, (url, result) in enumerate(zip(urls, results)):
+            if isinstance(result, Exception):
+                logger.info("Direct API fetch of %s failed (%s), retrying through the page.", url, result)
+                try:
+                    results[index] = get_json(self.page, url)
+                except Exception as exc:
+                    results[index] = exc
+        return results
+
+    def __get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the service's long-lived async client, creating it on first use.
+        Only called from coroutines on the run_async loop, which owns its connections.
+        """
+        if self.__async_client is None:
+            # Over HTTP/2 a fan-out is multiplexed on one connection to the API host,
+            # kept open between batches. If the server falls back to HTTP/1.1, up to
+            # max_connections connections stay alive for reuse.
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            # Connection failures are retried by the transport on the same pool
+            transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=HTTP_CONNECT_RETRIES)
+            self.__async_client = httpx.AsyncClient(transport=transport, timeout=20.0)
+        return self.__async_client
+
     def get_event(self, event_id: int) -> Event:
         # ... (Existing get_event logic) ...
         """
@@ -219,9 +357,40 @@ class SofascoreService:
             data = get_json(self.page, url)["event"]
             return parse_event(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get event {event_id}: {str(exc)}")
+            logger.error("Failed to get event %s: %s", event_id, exc)
             raise exc
 
+    def get_events_by_ids(self, event_ids: Iterable[int]) -> Dict[int, Optional[Event]]:
+        """
+        Get the event information for many events concurrently.
+
+        One fan-out over the direct API path replaces a get_event() page load
+        per id; ids the direct path fails for are retried through the page.
+        Events that could not be fetched either way map to None.
+
+        Args:
+            event_ids (Iterable[int]): The event IDs.
+
+        Returns:
+            Dict[int, Optional[Event]]: The parsed event per ID.
+        """
+        event_ids = list(dict.fromkeys(event_ids))
+        if not event_ids:
+            return {}
+        urls = [self.endpoints.event_endpoint.format(event_id=event_id) for event_id in event_ids]
+        results = self.__get_json_many(urls, self.max_connections)
+
+        events = {}
+        for event_id, result in zip(event_ids, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                events[event_id] = parse_event(result["event"])
+            except Exception as exc:
+                logger.error("Failed to get event %s: %s", event_id, exc)
+                events[event_id] = None
+        return events
+
     def get_events(self, date: str = 'today') -> list[Event]:
         # ... (Existing get_events logic) ...
         """
@@ -233,7 +402,7 @@ class SofascoreService:
             url = self.endpoints.events_endpoint.format(date=date)
             return parse_events(get_json(self.page, url)["events"])
         except Exception as exc:
-            self.logger.error(f"Failed to get events for date {date}: {str(exc)}")
+            logger.error("Failed to get events for date %s: %s", date, exc)
             raise exc
 
     def get_live_events(self) -> list[Event]:
@@ -251,13 +420,13 @@ class SofascoreService:
             data = get_json(self.page, url).get("events", []) 
             
             if not data:
-                self.logger.info("No live events found in API response.")
+                logger.info("No live events found in API response.")
                 return []
                 
             return parse_events(data)
             
         except Exception as exc:
-            self.logger.error(f"Failed to get live events: {str(exc)}")
+            logger.error("Failed to get live events: %s", exc)
             raise exc
 
     # ... (Rest of the service methods: get_player, get_match_lineups, get_team, etc.) ...
@@ -267,16 +436,32 @@ class SofascoreService:
         Get the player information.
         """
         try:
-            url = self.endpoints.player_endpoint.format(player_id=player_id)
-            data = get_json(self.page, url)
+            # The three requests only depend on player_id, so they go out together
+            # on the direct API path instead of three sequential page loads; any
+            # that fails falls back to the page.
+            urls = [
+                self.endpoints.player_endpoint.format(player_id=player_id),
+                self.endpoints.player_attributes_endpoint.format(player_id=player_id),
+                self.endpoints.player_transfer_history_endpoint.format(player_id=player_id),
+            ]
+            results = self.__get_json_many(urls, len(urls))
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            data, attributes_data, transfers_data = results
+
             if "player" in data:
                 player = parse_player(data["player"])
-                player.attributes = self.get_player_attributes(player_id)
-                player.transfer_history = self.get_player_transfer_history(player_id)
+                player.attributes = (
+                    parse_player_attributes(attributes_data["playerAttributes"])
+                    if "playerAttributes" in attributes_data
+                    else PlayerAttributes()
+                )
+                player.transfer_history = parse_transfer_history(transfers_data)
                 return player
             return Player()
         except Exception as exc:
-            self.logger.error(f"Failed to get player {player_id}: {str(exc)}")
+            logger.error("Failed to get player %s: %s", player_id, exc)
             raise exc
 
     def get_player_attributes(self, player_id: int) -> PlayerAttributes:
@@ -290,7 +475,7 @@ class SofascoreService:
                 return parse_player_attributes(data["playerAttributes"])
             return PlayerAttributes()
         except Exception as exc:
-            self.logger.error(f"Failed to get player attributes {player_id}: {str(exc)}")
+            logger.error("Failed to get player attributes %s: %s", player_id, exc)
             raise exc
 
     def get_player_transfer_history(self, player_id: int) -> TransferHistory:
@@ -304,7 +489,7 @@ class SofascoreService:
                 return parse_transfer_history(data)
             return TransferHistory()
         except Exception as exc:
-            self.logger.error(f"Failed to get transfer history for player {player_id}: {str(exc)}")
+            logger.error("Failed to get transfer history for player %s: %s", player_id, exc)
             raise exc
 
     def get_player_stats(self, player_id: int) -> dict:
@@ -315,7 +500,7 @@ class SofascoreService:
             url = self.endpoints.player_stats_endpoint.format(player_id=player_id)
             return get_json(self.page, url)
         except Exception as exc:
-            self.logger.error(f"Failed to get player stats {player_id}: {str(exc)}")
+            logger.error("Failed to get player stats %s: %s", player_id, exc)
             raise exc
 
     def get_match_lineups(self, event_id: int) -> Lineups:
@@ -326,7 +511,7 @@ class SofascoreService:
             url = self.endpoints.match_lineups_endpoint.format(event_id=event_id)
             return parse_lineups(get_json(self.page, url))
         except Exception as exc:
-            self.logger.error(f"Failed to get lineups for event {event_id}: {str(exc)}")
+            logger.error("Failed to get lineups for event %s: %s", event_id, exc)
             raise exc
 
     def get_match_incidents(self, event_id: int) -> list[Incident]:
@@ -338,7 +523,7 @@ class SofascoreService:
             data = get_json(self.page, url)["incidents"]
             return parse_incidents(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get incidents for event {event_id}: {str(exc)}")
+            logger.error("Failed to get incidents for event %s: %s", event_id, exc)
             raise exc
 
     def get_match_top_players(self, event_id: int) -> TopPlayersMatch:
@@ -349,7 +534,7 @@ class SofascoreService:
             url = self.endpoints.match_top_players_endpoint.format(event_id=event_id)
             return parse_top_players_match(get_json(self.page, url))
         except Exception as exc:
-            self.logger.error(f"Failed to get top players for event {event_id}: {str(exc)}")
+            logger.error("Failed to get top players for event %s: %s", event_id, exc)
             raise exc
 
     def get_match_comments(self, event_id: int) -> list[Comment]:
@@ -361,7 +546,7 @@ class SofascoreService:
             data = get_json(self.page, url)["comments"]
             return parse_comments(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get comments for event {event_id}: {str(exc)}")
+            logger.error("Failed to get comments for event %s: %s", event_id, exc)
             raise exc
 
     def get_match_stats(self, event_id: int) -> MatchStats:
@@ -369,13 +554,24 @@ class SofascoreService:
         Get the match statistics.
         """
         try:
-            url = self.endpoints.match_stats_endpoint.format(event_id=event_id)
-            data = get_json(self.page, url).get("statistics", {})
-            url = self.endpoints.match_probabilities_endpoint.format(event_id=event_id)
-            win_probabilities = get_json(self.page, url).get("winProbability", {})
-            return parse_match_stats(data, win_probabilities)
+            # Both payloads only depend on event_id, so they go out together
+            # on the direct API path (falling back to the page per URL); only
+            # the subtrees read below are used.
+            urls = [
+                self.endpoints.match_stats_endpoint.format(event_id=event_id),
+                self.endpoints.match_probabilities_endpoint.format(event_id=event_id),
+            ]
+            results = self.__get_json_many(urls, len(urls))
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+            stats_data, probabilities_data = results
+            return parse_match_stats(
+                stats_data.get("statistics", {}),
+                probabilities_data.get("winProbability", {}),
+            )
         except Exception as exc:
-            self.logger.error(f"Failed to get stats for event {event_id}: {str(exc)}")
+            logger.error("Failed to get stats for event %s: %s", event_id, exc)
             raise exc
 
     def get_match_shots(self, event_id: int) -> dict:
@@ -389,7 +585,7 @@ class SofascoreService:
                 return parse_shots(data["shotmap"])
             return Shot()
         except Exception as exc:
-            self.logger.error(f"Failed to get shots for event {event_id}: {str(exc)}")
+            logger.error("Failed to get shots for event %s: %s", event_id, exc)
             raise exc
 
     def get_team(self, team_id: int) -> Team:
@@ -401,7 +597,7 @@ class SofascoreService:
             data = get_json(self.page, url)["team"]
             return parse_team(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get team {team_id}: {str(exc)}")
+            logger.error("Failed to get team %s: %s", team_id, exc)
             raise exc
 
     def get_team_players(self, team_id: int) -> list[Player]:
@@ -410,12 +606,10 @@ class SofascoreService:
         """
         try:
             url = self.endpoints.team_players_endpoint.format(team_id=team_id)
-            return [
-                parse_player(player["player"])
-                for player in get_json(self.page, url)["players"]
-            ]
+            players = get_json(self.page, url)["players"]
+            return list(map(parse_player, (player["player"] for player in players)))
         except Exception as exc:
-            self.logger.error(f"Failed to get team players for team {team_id}: {str(exc)}")
+            logger.error("Failed to get team players for team %s: %s", team_id, exc)
             raise exc
 
     def get_team_events(self, team_id: int, upcoming: bool, page: int) -> list[Event]:
@@ -423,13 +617,15 @@ class SofascoreService:
         Get the team events.
         """
         try:
-            url = self.endpoints.team_events_endpoint.format(team_id=team_id, upcoming=int(upcoming), page=page)
+            url = self.endpoints.team_events_endpoint.format(
+                team_id=team_id, upcoming=self.endpoints.EVENTS_DIRECTION[upcoming], page=page
+            )
             data = get_json(self.page, url)
             if "events" in data:
                 return parse_events(data["events"])
             return []
         except Exception as exc:
-            self.logger.error(f"Failed to get team events for team {team_id}: {str(exc)}")
+            logger.error("Failed to get team events for team %s: %s", team_id, exc)
             raise exc
 
     def get_tournaments_by_category(self, category_id: Category) -> list[Tournament]:
@@ -443,7 +639,7 @@ class SofascoreService:
             data = get_json(self.page, url)["groups"][0].get("uniqueTournaments", [])
             return parse_tournaments(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get tournaments for category {category_id}: {str(exc)}")
+            logger.error("Failed to get tournaments for category %s: %s", category_id, exc)
             raise exc
 
     def get_tournament_seasons(self, tournament_id: int) -> list[Season]:
@@ -455,9 +651,10 @@ class SofascoreService:
             data = get_json(self.page, url)["seasons"]
             return parse_seasons(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get seasons for tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get seasons for tournament %s: %s", tournament_id, exc)
             raise exc
 
+    @_normalize_tournament_season_ids
     def get_tournament_bracket(
         self, tournament_id: int | Tournament, season_id: int | Season
     ) -> list[Bracket]:
@@ -465,17 +662,14 @@ class SofascoreService:
         Get the tournament bracket.
         """
         try:
-            if isinstance(tournament_id, Tournament):
-                tournament_id = tournament_id.id
-            if isinstance(season_id, Season):
-                season_id = season_id.id
             url = self.endpoints.tournament_bracket_endpoint.format(tournament_id=tournament_id, season_id=season_id)
             data = get_json(self.page, url)["cupTrees"]
             return parse_brackets(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get bracket for tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get bracket for tournament %s: %s", tournament_id, exc)
             raise exc
 
+    @_normalize_tournament_season_ids
     def get_tournament_standings(
         self, tournament_id: int | Tournament, season_id: int | Season
     ) -> list[Standing]:
@@ -483,17 +677,14 @@ class SofascoreService:
         Get the tournament standings.
         """
         try:
-            if isinstance(tournament_id, Tournament):
-                tournament_id = tournament_id.id
-            if isinstance(season_id, Season):
-                season_id = season_id.id
             url = self.endpoints.tournament_standings_endpoint.format(tournament_id=tournament_id, season_id=season_id)
             data = get_json(self.page, url)["standings"]
             return parse_standings(data)
         except Exception as exc:
-            self.logger.error(f"Failed to get standings for tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get standings for tournament %s: %s", tournament_id, exc)
             raise exc
 
+    @_normalize_tournament_season_ids
     def get_tournament_top_teams(
         self, tournament_id: int | Tournament, season_id: int | Season
     ) -> TopTournamentTeams:
@@ -501,19 +692,16 @@ class SofascoreService:
         Get different top teams of a tournament.
         """
         try:
-            if isinstance(tournament_id, Tournament):
-                tournament_id = tournament_id.id
-            if isinstance(season_id, Season):
-                season_id = season_id.id
             url = self.endpoints.tournament_topteams_endpoint.format(tournament_id=tournament_id, season_id=season_id)
             response = get_json(self.page, url)
             if "topTeams" in response:
                 return parse_top_tournament_teams(response["topTeams"])
             return TopTournamentTeams()
         except Exception as exc:
-            self.logger.error(f"Failed to get top teams for tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get top teams for tournament %s: %s", tournament_id, exc)
             raise exc
 
+    @_normalize_tournament_season_ids
     def get_tournament_top_players(
         self, tournament_id: int | Tournament, season_id: int | Season
     ) -> TopTournamentPlayers:
@@ -521,10 +709,6 @@ class SofascoreService:
         Get the top players of the tournament.
         """
         try:
-            if isinstance(tournament_id, Tournament):
-                tournament_id = tournament_id.id
-            if isinstance(season_id, Season):
-                season_id = season_id.id
             url = self.endpoints.tournament_topplayers_endpoint.format(
                 tournament_id=tournament_id, season_id=season_id
             )
@@ -533,7 +717,7 @@ class SofascoreService:
                 return parse_top_tournament_players(data["topPlayers"])
             return TopTournamentPlayers()
         except Exception as exc:
-            self.logger.error(f"Failed to get top players for tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get top players for tournament %s: %s", tournament_id, exc)
             raise exc
 
     def get_tournament_events(
@@ -544,14 +728,14 @@ class SofascoreService:
         """
         try:
             url = self.endpoints.tournament_events_endpoint.format(
-                tournament_id=tournament_id, season_id=season_id, upcoming=int(upcoming), page=page
+                tournament_id=tournament_id, season_id=season_id, upcoming=self.endpoints.EVENTS_DIRECTION[upcoming], page=page
             )
             data = get_json(self.page, url)
             if "events" in data:
                 return parse_events(data["events"])
             return []
         except Exception as exc:
-            self.logger.error(f"Failed to get events for tournament {tournament_id}: {str(exc)}")
+            logger.error("Failed to get events for tournament %s: %s", tournament_id, exc)
             raise exc
 
     def search(
@@ -565,33 +749,21 @@ class SofascoreService:
             url = self.endpoints.search_endpoint(query=query, entity_type=entity_type)
             results = get_json(self.page, url)["results"]
 
-            specific_parsers = {
-                EntityType.TEAM: parse_team,
-                EntityType.PLAYER: parse_player,
-                EntityType.EVENT: parse_event,
-                EntityType.TOURNAMENT: parse_tournament,
-            }
-
             if entity == EntityType.ALL:
-                type_parsers = {
-                    "team": parse_team,
-                    "player": parse_player,
-                    "event": parse_events,
-                    "uniqueTournament": parse_tournament,
-                }
+                get_parser = _SEARCH_TYPE_PARSERS.get
                 entities = []
+                append, extend = entities.append, entities.extend
                 for result in results:
-                    result_type = result.get("type")
                     entity_data = result.get("entity")
-                    parser = type_parsers.get(result_type, lambda x: x)
+                    parser = get_parser(result.get("type"), _identity)
                     if isinstance(entity_data, list): # handle 'event' which returns list of events
-                        entities.extend(parser(entity_data))
+                        extend(parser(entity_data))
                     else:
-                        entities.append(parser(entity_data))
+                        append(parser(entity_data))
                 return entities
             
-            parser = specific_parsers.get(entity, lambda x: x)
-            return [parser(result.get("entity")) for result in results]
+            parser = _SEARCH_SPECIFIC_PARSERS.get(entity, _identity)
+            return list(map(parser, (result.get("entity") for result in results)))
         except Exception as exc:
-            self.logger.error(f"Failed to search for '{query}': {str(exc)}")
+            logger.error("Failed to search for '%s': %s", query, exc)
             raise exc
@@ -3,13 +3,14 @@ SofaScore Standing dataclass.
 """
 import logging
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from itertools import repeat
+from typing import List, Dict, Any, Callable, Optional, Sequence
 from .tournament import Tournament, parse_tournament
 from .team import Team, parse_team
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class StandingItem:
     """
     StandingItem dataclass
@@ -17,7 +18,7 @@ class StandingItem:
     # Use Optional[int] and default=None for fields that might be missing
     id: Optional[int] = field(default=None)
     team: Optional[Team] = field(default=None)
-    descriptions: List[str] = field(default_factory=list)
+    descriptions: Sequence[str] = ()
     promotion: Dict[str, Any] = field(default_factory=dict)
     
     # Statistical fields are now Optional[int]
@@ -33,53 +34,72 @@ class StandingItem:
     score_diff_formatted: Optional[str] = field(default=None)
 
 
-def parse_standing_item(data: dict) -> StandingItem:
+# JSON keys of the statistical StandingItem fields, in field order (position .. score_diff_formatted)
+_STANDING_ITEM_STAT_KEYS = (
+    "position",
+    "matches",
+    "wins",
+    "scoresFor",
+    "scoresAgainst",
+    "losses",
+    "draws",
+    "points",
+    "scoreDiffFormatted",
+)
+
+def _parse_by_id(parse: Callable[[dict], Any], data: dict, cache: Optional[Dict[int, Any]]) -> Any:
+    """Parse data with parse, reusing the object already parsed for the same id in cache."""
+    entity_id = data.get("id")
+    if cache is None or entity_id is None:
+        return parse(data)
+    parsed = cache.get(entity_id)
+    if parsed is None:
+        parsed = cache[entity_id] = parse(data)
+    return parsed
+
+
+def parse_standing_item(data: dict, team_cache: Optional[Dict[int, Team]] = None) -> StandingItem:
     """
     Parse standing item data.
 
     Args:
         data (dict): Standing item data.
+        team_cache (Optional[Dict[int, Team]]): Teams already parsed, by id.
 
     Returns:
         StandingItem: Standing item dataclass
     """
-    # Use .get() without a default of 0 to return None if the key is missing
+    # Use .get() without a default of 0 to return None if the key is missing;
+    # the statistical fields are filled positionally from _STANDING_ITEM_STAT_KEYS
     return StandingItem(
-        id=data.get("id"),
-        team=parse_team(data.get("team", {})),
-        descriptions=data.get("descriptions", []),
-        promotion=data.get("promotion", {}),
-        position=data.get("position"),
-        matches=data.get("matches"),
-        wins=data.get("wins"),
-        scores_for=data.get("scoresFor"),
-        scores_against=data.get("scoresAgainst"),
-        losses=data.get("losses"),
-        draws=data.get("draws"),
-        points=data.get("points"),
-        score_diff_formatted=data.get("scoreDiffFormatted"),
+        data.get("id"),
+        _parse_by_id(parse_team, data.get("team", {}), team_cache),
+        data.get("descriptions") or (),
+        data.get("promotion", {}),
+        *map(data.get, _STANDING_ITEM_STAT_KEYS),
     )
 
 
-def parse_standing_items(data: list) -> List[StandingItem]:
+def parse_standing_items(data: list, team_cache: Optional[Dict[int, Team]] = None) -> List[StandingItem]:
     """
     Parse standing item data.
 
     Args:
         data (list): List of Standing item data.
+        team_cache (Optional[Dict[int, Team]]): Teams already parsed, by id.
 
     Returns:
         List[StandingItem]: List of Standing item dataclass
     """
     # Defensive check to ensure we are iterating over a list
     if not isinstance(data, list):
-        logger.warning(f"Expected a list for standing items data, got {type(data)}")
+        logger.warning("Expected a list for standing items data, got %s", type(data))
         return []
         
-    return [parse_standing_item(standing_item) for standing_item in data]
+    return list(map(parse_standing_item, data, repeat(team_cache)))
 
 
-@dataclass
+@dataclass(slots=True)
 class Standing:
     """Standing dataclass"""
 
@@ -91,12 +111,18 @@ class Standing:
     # description: str = field(default=None)
 
 
-def parse_standing(data: dict) -> Standing:
+def parse_standing(
+    data: dict,
+    team_cache: Optional[Dict[int, Team]] = None,
+    tournament_cache: Optional[Dict[int, Tournament]] = None,
+) -> Standing:
     """
     Parse standing data.
 
     Args:
         data (dict): Standing data.
+        team_cache (Optional[Dict[int, Team]]): Teams already parsed, by id.
+        tournament_cache (Optional[Dict[int, Tournament]]): Tournaments already parsed, by id.
 
     Returns:
         Standing: Standing dataclass
@@ -105,14 +131,14 @@ def parse_standing(data: dict) -> Standing:
     standing_items_data = data.get("rows", [])
     if not isinstance(standing_items_data, list):
         standing_items_data = []
-        logger.warning(f"Unexpected data type for standing rows: {type(data.get('rows'))}")
+        logger.warning("Unexpected data type for standing rows: %s", type(data.get('rows')))
         
     return Standing(
         id=data.get("id"),
         name=data.get("name"),
-        tournament=parse_tournament(data.get("tournament", {})),
+        tournament=_parse_by_id(parse_tournament, data.get("tournament", {}), tournament_cache),
         last_updated=data.get("updatedAtTimestamp"),
-        items=parse_standing_items(standing_items_data),
+        items=parse_standing_items(standing_items_data, team_cache),
         # description=data.get("description"),
     )
 
@@ -129,7 +155,10 @@ def parse_standings(data: list) -> List[Standing]:
     """
     # Defensive check to ensure the top level is a list of standings
     if not isinstance(data, list):
-        logger.error(f"Expected a list for standings data, got {type(data)}")
+        logger.error("Expected a list for standings data, got %s", type(data))
         return []
         
-    return [parse_standing(standing) for standing in data]
+    # The total/home/away tables list the same teams and tournament; parse each once
+    team_cache: Dict[int, Team] = {}
+    tournament_cache: Dict[int, Tournament] = {}
+    return [parse_standing(standing, team_cache, tournament_cache) for standing in data]
@@ -4,7 +4,9 @@ This module contains utility functions that are used in the project.
 
 import re
 import time
-import json
+import orjson
+import asyncio
+import threading
 from datetime import datetime
 import httpx
 from lxml import html
@@ -14,6 +16,27 @@ import logging # 🟢 ADDED: Logging module import
 # 🟢 ADDED: Setup logger for this module
 logger = logging.getLogger("esd.utils") 
 
+# 🛑 CRITICAL FIX: Headers to bypass 403 Forbidden for direct API calls.
+# We must mimic a legitimate browser request.
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.88 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Crucial headers for cross-site requests to trick the API firewall
+    'Origin': 'https://www.sofascore.com',
+    'Referer': 'https://www.sofascore.com/',
+    'x-requested-with': 'XMLHttpRequest', 
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'same-site',
+}
+
+# Transport-level retries for failed connects (DNS, resets, connect timeouts)
+HTTP_CONNECT_RETRIES = 2
+
+# Background event loop that run_async submits to; started on first use
+_ASYNC_LOOP = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+
 
 def get_today() -> str:
 # ... (rest of function remains the same)
@@ -68,31 +91,23 @@ def get_json(page: Page, url: str) -> dict:
     Returns:
         dict: The JSON response.
     """
-    
-    # 🛑 CRITICAL FIX: Headers to bypass 403 Forbidden for direct API calls.
-    # We must mimic a legitimate browser request.
-    HEADERS = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.88 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'en-US,en;q=0.9',
-        # Crucial headers for cross-site requests to trick the API firewall
-        'Origin': 'https://www.sofascore.com',
-        'Referer': 'https://www.sofascore.com/',
-        'x-requested-with': 'XMLHttpRequest', 
-        'sec-fetch-mode': 'cors',
-        'sec-fetch-site': 'same-site',
-    }
-
 
     try:
         if page is None:
             # This is the direct API call path
-            with httpx.Client(timeout=20.0) as client: # Increased timeout for resilience
+            transport = httpx.HTTPTransport(retries=HTTP_CONNECT_RETRIES)
+            with httpx.Client(transport=transport, timeout=20.0) as client: # Increased timeout for resilience
                 # FIX: Pass the headers here!
                 response = client.get(url, headers=HEADERS)
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
         
+        # Playwright API request path: sent with the page's context (cookies),
+        # on pooled connections and without loading or parsing a document.
+        data = _get_json_via_request(page, url)
+        if data is not None:
+            return data
+
         # This is the Playwright/Scraping path
         page.goto(url, wait_until="networkidle")
         content = page.content()
@@ -102,9 +117,9 @@ def get_json(page: Page, url: str) -> dict:
         if pre_text_list:
             json_string = pre_text_list[0].strip()
             try:
-                data = json.loads(json_string)
-                if "error" in data and "code" in data["error"]:
-                    code = data["error"]["code"]
+                data = orjson.loads(json_string)
+                code = _error_code(data)
+                if code is not None:
                     # 🟢 FIX: Replace print() with proper logging
                     if code == 403:
                         logger.warning(
@@ -114,7 +129,7 @@ def get_json(page: Page, url: str) -> dict:
                         logger.info("Sofascore API endpoint returned 404, resource not found.") # 🟢 FIX APPLIED HERE
                     return {}
                 return data
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Could not decode JSON from response:", exc_info=True) # 🟢 Logging the error properly
                 return {}
         return {}
@@ -125,6 +140,120 @@ def get_json(page: Page, url: str) -> dict:
         raise exc
 
 
+def _error_code(data) -> int | None:
+    """
+    Get the code of a Sofascore {"error": {"code": ...}} payload, or None for regular data.
+    """
+    if isinstance(data, dict):
+        error = data.get("error")
+        if isinstance(error, dict) and "code" in error:
+            return error["code"]
+    return None
+
+
+def _get_json_via_request(page: Page, url: str) -> dict | None:
+    """
+    Get the JSON response through the page's APIRequestContext.
+
+    Args:
+        page (Page): The Playwright page object.
+        url (str): The URL to get the JSON response.
+
+    Returns:
+        dict | None: The JSON response ({} for a 404), or None when the caller
+            should fall back to a page load (firewall status, non-JSON body,
+            error payload or request failure).
+    """
+    try:
+        response = page.request.get(url, headers=HEADERS)
+        if response.status == 404:
+            return {}
+        if not response.ok:
+            logger.info("Sofascore API request returned %s, falling back to page load.", response.status)
+            return None
+        data = orjson.loads(response.body())
+    except orjson.JSONDecodeError:
+        logger.info("Sofascore API request returned a non-JSON body, falling back to page load.")
+        return None
+    except Exception as exc:
+        logger.info("Sofascore API request failed (%s), falling back to page load.", exc)
+        return None
+
+    code = _error_code(data)
+    if code == 404:
+        return {}
+    if code is not None:
+        logger.info("Sofascore API request returned error code %s, falling back to page load.", code)
+        return None
+    return data
+
+
+async def get_json_async(client: httpx.AsyncClient, url: str) -> dict:
+    """
+    Get the JSON response from the given URL without blocking the event loop.
+    Uses the direct API path of get_json (no Playwright page).
+
+    Args:
+        client (httpx.AsyncClient): A shared async client (connection pool).
+        url (str): The URL to get the JSON response.
+
+    Returns:
+        dict: The JSON response.
+    """
+    try:
+        response = await client.get(url, headers=HEADERS)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    except httpx.HTTPStatusError as exc:
+        if exc.response.status_code == 404:
+            return {}
+        raise exc
+
+
+def get_async_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the persistent background event loop, starting its thread on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: The loop run_async submits coroutines to.
+    """
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="esd-async", daemon=True).start()
+            _ASYNC_LOOP = loop
+    return _ASYNC_LOOP
+
+
+def run_async(coro, timeout: float = None):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    The Playwright sync API leaves its own event loop registered on the
+    calling thread, so asyncio.run() cannot be used there directly. The
+    coroutine is submitted to one persistent loop on a background thread
+    instead, so loop-bound resources (e.g. a pooled AsyncClient) survive
+    between calls. Must not be called from that loop's own thread.
+
+    Args:
+        coro (Coroutine): The coroutine to run.
+        timeout (float): Seconds to wait for the result (None waits indefinitely).
+
+    Returns:
+        Any: The coroutine result.
+
+    Raises:
+        TimeoutError: If the coroutine did not finish within timeout; it is cancelled.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_async_loop())
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
 def get_document(proxies: dict = None, url: str = None) -> html.HtmlElement:
 # ... (rest of function remains the same)
     """
@@ -1,13 +1,21 @@
 # main.py
 # The primary execution and loop control for the Football Betting Bot with GRACEFUL SHUTDOWN.
 
-import time
+import asyncio
 import signal
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 # Import all necessary functions and constants from the bot logic file
-from bot import run_bot_cycle, SLEEP_TIME, initialize_bot_services, shutdown_bot
+from bot import (
+    run_bot_cycle,
+    SLEEP_TIME,
+    initialize_bot_services,
+    shutdown_bot,
+    start_telegram_delivery,
+    stop_telegram_delivery,
+)
 
 # Set up logger for the executor
 logger = logging.getLogger("MainExecutor")
@@ -16,53 +24,98 @@ logger.setLevel(logging.INFO)
 # Global flag to control the loop and signal shutdown
 RUNNING = True
 CHECK_INTERVAL = SLEEP_TIME
+CYCLE_TIMEOUT = 300 # A cycle stuck for 5 minutes is reported instead of silently stalling the loop
 
-def signal_handler(signum, frame):
+# The Playwright sync API is bound to the thread that started it, so service
+# initialization, every cycle and the shutdown all run on this single thread
+# while the event loop stays free for scheduling and signal handling.
+BOT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bot-cycle")
+
+def signal_handler(signum, stop_event: asyncio.Event):
     """
     Handles OS signals (like SIGTERM from Railway) for graceful shutdown.
-    Sets the global RUNNING flag to False to break the main loop.
+    Sets the global RUNNING flag to False to break the main loop and wakes
+    the loop up if it is sleeping between cycles.
     """
     global RUNNING
     logger.warning(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Signal {signum} received. Initiating graceful shutdown...")
     RUNNING = False
+    stop_event.set()
 
-def main():
+async def run_in_bot_thread(func, *args):
+    """Runs a blocking bot function on BOT_EXECUTOR without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(BOT_EXECUTOR, func, *args)
+
+async def main_async():
     """
-    Initializes services, runs the main bot loop, and ensures resource cleanup.
+    Initializes services, runs the main bot loop on the event loop, and ensures resource cleanup.
     """
     print("🚀 Football Betting Bot Executor Started")
-    
+
     # 1. Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)  # Ctrl+C
-    signal.signal(signal.SIGTERM, signal_handler) # OS/Container stop signal (CRITICAL for Playwright cleanup)
-    
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    loop.add_signal_handler(signal.SIGINT, signal_handler, signal.SIGINT, stop_event)  # Ctrl+C
+    loop.add_signal_handler(signal.SIGTERM, signal_handler, signal.SIGTERM, stop_event) # OS/Container stop signal (CRITICAL for Playwright cleanup)
+
     # 2. ONE-TIME SERVICE INITIALIZATION
-    if not initialize_bot_services():
+    # Telegram sends from the bot thread are delivered by this loop from now on
+    start_telegram_delivery(loop)
+    if not await run_in_bot_thread(initialize_bot_services):
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ❌ FATAL: Bot services failed to initialize. Exiting.")
-        sys.exit(1)
-    
+        await asyncio.to_thread(BOT_EXECUTOR.shutdown, wait=True)
+        await stop_telegram_delivery()
+        return 1
+
     # 3. MAIN EXECUTION LOOP
+    cycle = None # Executor future of the cycle in flight
     while RUNNING:
         try:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 🤖 Starting bot cycle...")
-            # Using the revised run_bot_cycle which is safer than run_bot_once
-            run_bot_cycle() 
+            if cycle is None:
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 🤖 Starting bot cycle...")
+                # Using the revised run_bot_cycle which is safer than run_bot_once
+                cycle = loop.run_in_executor(BOT_EXECUTOR, run_bot_cycle)
+            else:
+                # A timed-out cycle is still running on BOT_EXECUTOR; keep waiting for it
+                # instead of queueing another cycle behind it.
+                logger.warning("Previous bot cycle is still running; not starting a new one.")
+            # asyncio.wait() neither cancels the future nor raises on timeout, so a
+            # TimeoutError raised by the cycle itself is not mistaken for ours.
+            done, _ = await asyncio.wait({cycle}, timeout=CYCLE_TIMEOUT)
+            if not done:
+                logger.error(f"Bot cycle exceeded {CYCLE_TIMEOUT} seconds.")
+                continue
+            finished, cycle = cycle, None
+            finished.result() # Re-raises the cycle's own exception
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ✅ Cycle complete.")
-            
+
         except Exception as e:
+            cycle = None
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ⚠️ UNEXPECTED CRITICAL ERROR in main loop: {e}")
             logger.critical(f"Unexpected error in cycle: {e}", exc_info=True)
-            
+
         finally:
-            if RUNNING: 
+            if RUNNING:
                 print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 💤 Sleeping for {CHECK_INTERVAL} seconds...\n")
-                time.sleep(CHECK_INTERVAL)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=CHECK_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
 
     # 4. GRACEFUL SHUTDOWN
     logger.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Shutting down bot resources...")
-    shutdown_bot()
+    await run_in_bot_thread(shutdown_bot)
+    await asyncio.to_thread(BOT_EXECUTOR.shutdown, wait=True)
+    await stop_telegram_delivery()
     logger.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Bot successfully shut down.")
-    sys.exit(0)
+    return 0
+
+def main():
+    """
+    Runs the bot on an asyncio event loop and exits with its status code.
+    """
+    sys.exit(asyncio.run(main_async()))
 
 if __name__ == "__main__":
     main()